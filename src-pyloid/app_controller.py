@@ -109,8 +109,11 @@ class AppController:
         # Start hotkey listener
         self.hotkey_service.start()
 
-        # Clean old history based on retention setting
-        self.db.clear_old_history(settings.retention)
+        # Clean old history based on retention setting (may delete audio files,
+        # so keep it off the startup path)
+        threading.Thread(
+            target=self.db.clear_old_history, args=(settings.retention,), daemon=True
+        ).start()
 
     def shutdown(self):
         """Clean shutdown."""
@@ -149,6 +152,11 @@ class AppController:
 
         info(f"Recorded {len(audio)} samples")
 
+        if self.audio_service.was_truncated():
+            warning("Recording hit the capture limit; the end was not recorded")
+            if self._on_error:
+                self._on_error("Recording was too long - only the beginning was transcribed")
+
         # Transcribe in background
         def transcribe():
             try:
@@ -399,6 +407,8 @@ class AppController:
             return {"success": False, "error": "No audio recorded", "transcript": ""}
 
         info(f"Test recorded {len(audio)} samples")
+        if self.audio_service.was_truncated():
+            warning("Test recording hit the capture limit; the end was not recorded")
 
         # Wait for model if needed
         wait_time = 0
@@ -3,12 +3,14 @@ from pyloid.utils import get_production_path, is_production
 from pyloid.serve import pyloid_serve
 from pyloid import Pyloid
 import sys
+import logging
+import threading
 
 from PySide6.QtCore import QObject, Signal, Qt, QTimer, QRect
-from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QScreen
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QColor, QCursor
 
-from server import server, register_onboarding_complete_callback, register_data_reset_callback, register_window_actions, register_download_progress_callback, register_visualizer_style_callback, register_popup_drag_callback
+from server import server, register_onboarding_complete_callback, register_data_reset_callback, register_window_actions, register_download_progress_callback, register_visualizer_style_callback, register_popup_drag_callback, register_popup_listening_callback
 from app_controller import get_controller
 from services.logger import setup_logging, get_logger
 
@@ -25,8 +27,11 @@ class ThreadSafeSignals(QObject):
     recording_started = Signal()
     recording_stopped = Signal()
     transcription_complete = Signal(str)
-    amplitude_changed = Signal(object)
+    amplitude_pending = Signal()
     visualizer_style_changed = Signal(str)
+    focus_requested = Signal()
+    error_occurred = Signal(str)
+    popup_listening = Signal()
 
 
 # Global signal emitter instance (created after QApplication)
@@ -43,12 +48,16 @@ def init_signals():
 # Single Instance Check (Issue #4: Multiple tray icons)
 # ============================================================================
 # Windows mutex-based single instance check as backup to Pyloid's single_instance
-# This prevents multiple tray icons when Pyloid's check fails or app crashes
+# This prevents multiple tray icons when Pyloid's check fails or app crashes.
+# A second launch signals the named focus event instead of searching for our window;
+# the running instance waits on it and brings the dashboard to the front.
 _instance_mutex = None
+_focus_event = None
+FOCUS_EVENT_NAME = "VoiceFlow_Focus_Event"
 
 def ensure_single_instance():
     """Ensure only one instance of VoiceFlow runs at a time using Windows mutex."""
-    global _instance_mutex
+    global _instance_mutex, _focus_event
 
     if sys.platform != 'win32':
         return True  # Only implement Windows mutex for now
@@ -64,24 +73,33 @@ def ensure_single_instance():
         kernel32 = ctypes.windll.kernel32
         mutex_name = "VoiceFlow_SingleInstance_Mutex"
 
+        EVENT_MODIFY_STATE = 0x0002
+        kernel32.CreateMutexW.restype = wintypes.HANDLE
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        kernel32.OpenEventW.restype = wintypes.HANDLE
+
         _instance_mutex = kernel32.CreateMutexW(None, False, mutex_name)
 
         if kernel32.GetLastError() == ERROR_ALREADY_EXISTS:
             log.warning("Another instance of VoiceFlow is already running")
-            # Try to focus the existing instance by finding its window
+            # Ask the running instance to focus its own window
             try:
-                user32 = ctypes.windll.user32
-                hwnd = user32.FindWindowW(None, "VoiceFlow")
-                if hwnd:
-                    # Show and bring to foreground
-                    SW_RESTORE = 9
-                    user32.ShowWindow(hwnd, SW_RESTORE)
-                    user32.SetForegroundWindow(hwnd)
-                    log.info("Focused existing VoiceFlow window")
+                event = kernel32.OpenEventW(EVENT_MODIFY_STATE, False, FOCUS_EVENT_NAME)
+                if event:
+                    # We were just launched by the user, so we hold the foreground
+                    # right; hand it on, or Windows only flashes the taskbar button
+                    ASFW_ANY = -1
+                    ctypes.windll.user32.AllowSetForegroundWindow(wintypes.DWORD(ASFW_ANY))
+                    kernel32.SetEvent(wintypes.HANDLE(event))
+                    kernel32.CloseHandle(wintypes.HANDLE(event))
+                    log.info("Signaled existing VoiceFlow instance to focus")
             except Exception as e:
                 log.warning("Could not focus existing window", error=str(e))
             return False
 
+        # Auto-reset event the running instance waits on (see start_focus_listener)
+        _focus_event = kernel32.CreateEventW(None, False, False, FOCUS_EVENT_NAME)
+
         log.info("Single instance check passed - mutex acquired")
         return True
 
@@ -90,6 +108,31 @@ def ensure_single_instance():
         return True  # Allow running if check fails
 
 
+def start_focus_listener():
+    """Wait on the focus event in a daemon thread; each signal focuses the dashboard."""
+    if _focus_event is None:
+        return
+
+    import ctypes
+    from ctypes import wintypes
+
+    INFINITE = 0xFFFFFFFF
+    WAIT_OBJECT_0 = 0
+    kernel32 = ctypes.windll.kernel32
+
+    def wait_for_focus_requests():
+        while True:
+            result = kernel32.WaitForSingleObject(wintypes.HANDLE(_focus_event), INFINITE)
+            if result != WAIT_OBJECT_0:
+                log.error("Focus event wait failed", result=result)
+                return
+            log.info("Focus requested by another instance")
+            if _signals:
+                _signals.focus_requested.emit()
+
+    threading.Thread(target=wait_for_focus_requests, daemon=True).start()
+
+
 # Check for existing instance before proceeding
 if not ensure_single_instance():
     log.info("Exiting - another instance is running")
@@ -102,8 +145,14 @@ if not ensure_single_instance():
 
 app = Pyloid(app_name="VoiceFlow", single_instance=True, server=server)
 
-app.set_icon(get_production_path("src-pyloid/icons/icon.png"))
-app.set_tray_icon(get_production_path("src-pyloid/icons/icon.png"))
+# Resolve paths and the frontend URL once — pyloid_serve starts a static file
+# server, so both windows must share a single instance.
+_ICON_PATH = get_production_path("src-pyloid/icons/icon.png")
+_IS_PROD = is_production()
+_FRONT_URL = pyloid_serve(directory=get_production_path("dist-front")) if _IS_PROD else "http://localhost:5173"
+
+app.set_icon(_ICON_PATH)
+app.set_tray_icon(_ICON_PATH)
 
 # Initialize thread-safe signals for cross-thread UI updates
 # Must be done after Pyloid creates QApplication
@@ -112,16 +161,22 @@ init_signals()
 # Initialize controller
 controller = get_controller()
 
-# Store reference to popup window
+# Store reference to popup window (created lazily on first recording)
 popup_window = None
+# True once the popup page has attached its event listeners (popup_listening RPC)
+_popup_ready = False
+# Popup state requested before the page was ready (None = idle)
+_pending_popup_state = None
 
 
 def show_dashboard():
     app.show_and_focus_main_window()
+    _install_geo_filter()
 
 
 def open_settings():
     app.show_and_focus_main_window()
+    _install_geo_filter()
     # Tell frontend to navigate to settings tab
     send_main_window_event('navigate', {'path': '/dashboard/settings'})
 
@@ -173,10 +228,14 @@ app.set_tray_menu_items([
 
 
 # Recording popup window management
-import json
-from PySide6.QtCore import QTimer
-from PySide6.QtGui import QColor, QCursor
-from PySide6.QtWidgets import QApplication
+# Popup window flags: stay-on-top, no taskbar icon, never steals focus
+_POPUP_FLAGS = (
+    Qt.FramelessWindowHint |
+    Qt.WindowStaysOnTopHint |
+    Qt.Tool |
+    Qt.WindowDoesNotAcceptFocus
+)
+_TRANSPARENT = QColor(0, 0, 0, 0)
 
 # Popup dimensions
 POPUP_IDLE_WIDTH = 55
@@ -186,6 +245,11 @@ POPUP_PILL_W = 245    # multiwave and bar (230 display SVG + padding)
 POPUP_PILL_H = 55
 POPUP_RING_W = 78     # ring (74 display SVG + margin)
 POPUP_RING_H = 78
+# Popup page load failures: retry this many times, then carry on regardless
+POPUP_LOAD_RETRIES = 3
+POPUP_LOAD_RETRY_MS = 1000
+# Loaded page that never reports its listeners (e.g. a stale frontend build)
+POPUP_READY_TIMEOUT_MS = 3000
 
 
 def get_popup_dims(style: str) -> tuple:
@@ -194,6 +258,9 @@ def get_popup_dims(style: str) -> tuple:
         return (POPUP_RING_W, POPUP_RING_H)
     return (POPUP_PILL_W, POPUP_PILL_H)  # multiwave, bar, or unknown
 
+# Set once the popup's native window flags have been applied
+_popup_flags_set = False
+
 # Screen info cache (for active monitor)
 _screen_x = 0        # Monitor X offset
 _screen_y = 0        # Monitor Y offset
@@ -201,29 +268,78 @@ _screen_width = 1920
 _screen_height = 1080
 
 
+# Geometry of every connected screen, keyed by screen name: (x, y, width, height).
+# Kept current by QGuiApplication screen signals (see init_screen_cache).
+_screens_cache: dict = {}
+# Bounding rectangle of all screens, rebuilt with the cache
+_virtual_desktop_rect = QRect()
+
+
+def _refresh_screen_cache(*_args):
+    """Re-read geometry for all screens. Slot for screen add/remove/geometry signals."""
+    global _virtual_desktop_rect
+    _screens_cache.clear()
+    desktop = QRect()
+    for screen in QApplication.screens():
+        geo = screen.geometry()
+        _screens_cache[screen.name()] = (geo.x(), geo.y(), geo.width(), geo.height())
+        desktop = desktop.united(geo)
+    _virtual_desktop_rect = desktop
+    if log.is_enabled_for(logging.DEBUG):
+        log.debug("Screen cache refreshed", screens=len(_screens_cache))
+
+
+def is_on_screen(rect: QRect) -> bool:
+    """Return True if rect overlaps a connected screen."""
+    if not _virtual_desktop_rect.intersects(rect):
+        return False
+    if len(_screens_cache) <= 1:
+        return True
+    # The bounding rect can include gaps between monitors — check each screen
+    return any(QRect(*geo).intersects(rect) for geo in _screens_cache.values())
+
+
+def _on_screen_added(screen):
+    screen.geometryChanged.connect(_refresh_screen_cache)
+    _refresh_screen_cache()
+
+
+def init_screen_cache():
+    """Populate the screen cache and subscribe to screen changes."""
+    qapp = QApplication.instance()
+    for screen in qapp.screens():
+        screen.geometryChanged.connect(_refresh_screen_cache)
+    qapp.screenAdded.connect(_on_screen_added)
+    qapp.screenRemoved.connect(_refresh_screen_cache)
+    qapp.primaryScreenChanged.connect(_refresh_screen_cache)
+    _refresh_screen_cache()
+
+
 def get_active_monitor_info():
     """Get the monitor where the cursor is currently located (for multi-monitor support)."""
     global _screen_x, _screen_y, _screen_width, _screen_height
     try:
-        # Get cursor position to determine active monitor
-        cursor_pos = QCursor.pos()
-
         # Find the screen containing the cursor
-        screen = QApplication.screenAt(cursor_pos)
+        screen = QApplication.screenAt(QCursor.pos())
         if screen is None:
             # Fallback to primary screen
             screen = QApplication.primaryScreen()
 
+        geometry = None
         if screen:
-            geometry = screen.geometry()
-            _screen_x = geometry.x()
-            _screen_y = geometry.y()
-            _screen_width = geometry.width()
-            _screen_height = geometry.height()
-            log.info("Active monitor detected",
-                     x=_screen_x, y=_screen_y,
-                     width=_screen_width, height=_screen_height,
-                     screen_name=screen.name())
+            geometry = _screens_cache.get(screen.name())
+            if geometry is None:
+                # Screen not seen yet (signal not delivered) — refresh once
+                _refresh_screen_cache()
+                geometry = _screens_cache.get(screen.name())
+
+        if geometry:
+            if geometry != (_screen_x, _screen_y, _screen_width, _screen_height):
+                _screen_x, _screen_y, _screen_width, _screen_height = geometry
+                log.info("Active monitor detected",
+                         x=_screen_x, y=_screen_y,
+                         width=_screen_width, height=_screen_height,
+                         screen_name=screen.name())
         else:
             # Ultimate fallback
             _screen_x = 0
@@ -250,6 +366,19 @@ def _popup_qwindow():
         return None
 
 
+def _apply_popup_window_flags(qwindow, webview):
+    """One-time native window setup. setWindowFlags recreates the native window
+    (and resets its position on Windows), so it must not run on every show/resize."""
+    global _popup_flags_set
+    # Set window flags for stay-on-top and no taskbar icon
+    qwindow.setWindowFlags(_POPUP_FLAGS)
+
+    # CRITICAL: Re-apply AFTER setWindowFlags — setWindowFlags resets this attribute
+    qwindow.setAttribute(Qt.WA_TranslucentBackground, True)
+    webview.page().setBackgroundColor(_TRANSPARENT)
+    _popup_flags_set = True
+
+
 def show_popup(width: int, height: int):
     """Size and move the popup into view. Window stays 'shown' off-screen to avoid flicker."""
     qw = _popup_qwindow()
@@ -261,20 +390,22 @@ def show_popup(width: int, height: int):
         saved = controller.settings_service.get_settings()
         if saved.popup_x is not None and saved.popup_y is not None:
             saved_rect = QRect(saved.popup_x, saved.popup_y, width, height)
-            on_screen = any(
-                screen.geometry().intersects(saved_rect)
-                for screen in QApplication.instance().screens()
-            )
-            if on_screen:
+            if is_on_screen(saved_rect):
                 target_x, target_y = saved.popup_x, saved.popup_y
         if target_x is None:
-            # Default: center-top of active monitor
+            # Default: center-top of the monitor the cursor is on
+            get_active_monitor_info()
             target_x = _screen_x + (_screen_width - width) // 2
             target_y = _screen_y + 16
 
+        if not _popup_flags_set:
+            # Fallback: init_popup failed before the flags were applied
+            _apply_popup_window_flags(qw, popup_window._window.web_view)
+
         # Resize then move — no hide/show cycle, renderer stays warm
         qw.setFixedSize(width, height)
-        qw.show()  # no-op if already visible; safety net for very first call
+        if not qw.isVisible():
+            qw.show()  # safety net; normally already shown off-screen
         qw.move(target_x, target_y)
     except Exception as e:
         log.error("Failed to show popup", error=str(e))
@@ -295,16 +426,14 @@ def resize_popup(width: int, height: int):
 
 def init_popup():
     """Initialize the recording popup."""
-    global popup_window
+    global popup_window, _popup_ready
     log.debug("init_popup called")
 
     try:
         if popup_window is None:
-            # Get active monitor info (where cursor is) for multi-monitor support
-            get_active_monitor_info()
-
             # Create window with idle size initially
             # frame=False makes it frameless, transparent=True enables transparency
+            _popup_ready = False
             popup_window = app.create_window(
                 title="Recording",
                 width=POPUP_IDLE_WIDTH,
@@ -318,26 +447,12 @@ def init_popup():
             webview = popup_window._window.web_view
 
             # CRITICAL: Set background color BEFORE loading URL
-            webview.page().setBackgroundColor(QColor(0, 0, 0, 0))
+            webview.page().setBackgroundColor(_TRANSPARENT)
 
             # Load the URL
-            if is_production():
-                url = pyloid_serve(directory=get_production_path("dist-front"))
-                popup_window.load_url(f"{url}#/popup")
-            else:
-                popup_window.load_url("http://localhost:5173#/popup")
-
-            # Set window flags for stay-on-top and no taskbar icon
-            qwindow.setWindowFlags(
-                Qt.FramelessWindowHint |
-                Qt.WindowStaysOnTopHint |
-                Qt.Tool |
-                Qt.WindowDoesNotAcceptFocus
-            )
+            popup_window.load_url(f"{_FRONT_URL}#/popup")
 
-            # CRITICAL: Re-apply AFTER setWindowFlags — setWindowFlags resets this attribute
-            qwindow.setAttribute(Qt.WA_TranslucentBackground, True)
-            webview.page().setBackgroundColor(QColor(0, 0, 0, 0))
+            _apply_popup_window_flags(qwindow, webview)
 
             qwindow.setFixedSize(POPUP_IDLE_WIDTH, POPUP_IDLE_HEIGHT)
 
@@ -346,25 +461,50 @@ def init_popup():
             qwindow.move(-32000, -32000)  # far off-screen — transparent window, never visible
             log.info("Popup window created (off-screen init)")
 
-            # After page loads: send idle state, install drag filter, park off-screen
-            # (Never truly hide — keeping the window "shown" off-screen prevents the
-            # Qt WebEngine renderer from suspending, which eliminates the flash/flicker
-            # that happens when hiding and re-showing causes a re-render.)
+            # loadFinished only means the document loaded; React attaches the
+            # popup-state listener in a later task, so events are held until the
+            # page reports it is listening (see _mark_popup_ready).
+            this_popup = popup_window
+            load_failures = 0
+
+            def on_ready_timeout():
+                if popup_window is this_popup and not _popup_ready:
+                    log.warning("Popup page never reported its listeners, marking ready")
+                    _mark_popup_ready()
+
             def on_page_loaded():
                 # Re-apply transparent background (dev mode webview may reset it)
                 try:
-                    webview.page().setBackgroundColor(QColor(0, 0, 0, 0))
+                    webview.page().setBackgroundColor(_TRANSPARENT)
                 except Exception:
                     pass
-                send_popup_event('popup-state', {'state': 'idle'})
                 _install_popup_drag_filter()
+
+            def retry_load():
+                if popup_window is this_popup:  # not destroyed in the meantime
+                    this_popup.load_url(f"{_FRONT_URL}#/popup")
+
+            def on_load_finished(ok):
+                nonlocal load_failures
+                if not ok:
+                    load_failures += 1
+                    if load_failures <= POPUP_LOAD_RETRIES:
+                        log.error("Popup page failed to load, retrying", attempt=load_failures)
+                        QTimer.singleShot(POPUP_LOAD_RETRY_MS, retry_load)
+                        return
                 try:
-                    qwindow.move(-32000, -32000)
-                    log.debug("Popup parked off-screen after initial load")
-                except Exception as e:
-                    log.error("Failed to park popup off-screen", error=str(e))
+                    webview.loadFinished.disconnect(on_load_finished)
+                except (RuntimeError, TypeError):
+                    pass
+                on_page_loaded()
+                if ok:
+                    QTimer.singleShot(POPUP_READY_TIMEOUT_MS, on_ready_timeout)
+                else:
+                    # Don't leave recordings queued behind a page that never loads
+                    log.error("Popup page failed to load, giving up on retries")
+                    _mark_popup_ready()
 
-            QTimer.singleShot(1200, on_page_loaded)
+            webview.loadFinished.connect(on_load_finished)
 
             # Install popup move event filter for position persistence
             _install_popup_move_filter(qwindow)
@@ -373,6 +513,50 @@ def init_popup():
     except Exception as e:
         log.error("Failed to initialize popup", error=str(e))
 
+def _mark_popup_ready():
+    """Popup can receive events: flush the state requested while it was loading,
+    or send idle and park it off-screen.
+
+    (Never truly hide — keeping the window "shown" off-screen prevents the
+    Qt WebEngine renderer from suspending, which eliminates the flash/flicker
+    that happens when hiding and re-showing causes a re-render.)
+    """
+    global _popup_ready, _pending_popup_state
+    _popup_ready = True
+
+    pending = _pending_popup_state
+    _pending_popup_state = None
+    if pending is not None:
+        # A recording started while the page was loading — show it now
+        style = controller.settings_service.get_settings().visualizer_style
+        show_popup(*get_popup_dims(style))
+        send_popup_event('popup-state', {'state': pending})
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug("Flushed pending popup state", state=pending)
+        return
+
+    send_popup_event('popup-state', {'state': 'idle'})
+    qw = _popup_qwindow()
+    if qw is not None:
+        try:
+            qw.move(-32000, -32000)
+            log.debug("Popup parked off-screen after initial load")
+        except Exception as e:
+            log.error("Failed to park popup off-screen", error=str(e))
+
+def _on_popup_listening_slot():
+    """Slot: popup page attached its event listeners - runs on main thread via signal."""
+    if popup_window is None or _popup_ready:
+        # Destroyed meanwhile, or a re-render/reload of a page that is already live
+        return
+    log.debug("Popup page is listening")
+    _mark_popup_ready()
+
+def on_popup_listening():
+    """Called from RPC thread - emits signal to main Qt thread."""
+    if _signals:
+        _signals.popup_listening.emit()
+
 def send_popup_event(name, detail):
     """Send event to popup window using Pyloid's invoke method."""
     global popup_window
@@ -384,8 +568,16 @@ def send_popup_event(name, detail):
 
 def _on_recording_start_slot():
     """Slot: Actual recording start handler - runs on main thread via signal."""
+    global _pending_popup_state
     log.info("Recording started")
-    style = controller.get_settings().get("visualizerStyle", "multiwave")
+    if popup_window is None:
+        # First recording of the session — create the popup now
+        init_popup()
+    if not _popup_ready:
+        # Page still loading; on_page_loaded shows the popup once it can render
+        _pending_popup_state = 'recording'
+        return
+    style = controller.settings_service.get_settings().visualizer_style
     w, h = get_popup_dims(style)
     show_popup(w, h)
     send_popup_event('popup-state', {'state': 'recording'})
@@ -397,7 +589,12 @@ def on_recording_start():
 
 def _on_recording_stop_slot():
     """Slot: Actual recording stop handler - runs on main thread via signal."""
+    global _pending_popup_state
     log.info("Recording stopped - processing")
+    if not _popup_ready:
+        if _pending_popup_state is not None:
+            _pending_popup_state = 'processing'
+        return
     # Keep active size during processing
     send_popup_event('popup-state', {'state': 'processing'})
 
@@ -408,7 +605,12 @@ def on_recording_stop():
 
 def _on_transcription_complete_slot(text: str):
     """Slot: Actual transcription complete handler - runs on main thread via signal."""
+    global _pending_popup_state
     log.info("Transcription complete", text_length=len(text))
+    if not _popup_ready:
+        # Nothing shown yet — let on_page_loaded park the popup as idle
+        _pending_popup_state = None
+        return
     send_popup_event('popup-state', {'state': 'idle'})
     qw = _popup_qwindow()
     if qw is not None:
@@ -422,6 +624,19 @@ def on_transcription_complete(text: str):
     if _signals:
         _signals.transcription_complete.emit(text)
 
+def _on_error_slot(message: str):
+    """Slot: surface a background error as a tray notification - runs on main thread."""
+    log.warning("Notifying user of error", message=message)
+    try:
+        app.show_notification("VoiceFlow", message)
+    except Exception as e:
+        log.error("Failed to show error notification", error=str(e))
+
+def on_error(message: str):
+    """Called from worker threads - emits signal to main Qt thread."""
+    if _signals:
+        _signals.error_occurred.emit(message)
+
 def send_main_window_event(name, detail):
     """Send event to main window using Pyloid's invoke method."""
     global window
@@ -431,17 +646,61 @@ def send_main_window_event(name, detail):
         except Exception as e:
             log.error("Failed to send main window event", event=name, error=str(e))
 
-def _on_amplitude_slot(data):
-    """Slot: Actual amplitude handler - runs on main thread via signal."""
+# ---- Amplitude coalescing ----
+# The audio thread only stashes the latest visualizer frame; a main-thread timer
+# forwards it to the webviews at most once per AMPLITUDE_FLUSH_MS (last value wins).
+# The timer arms itself on the first frame and stops once frames stop arriving,
+# so it covers both hotkey recordings and the onboarding mic test without idle wakeups.
+AMPLITUDE_FLUSH_MS = 33
+AMPLITUDE_IDLE_TICKS = 10  # stop after ~330ms without new frames
+
+_amp_timer: QTimer = None
+_last_amp = None
+_last_sent_amp = None  # last frame actually delivered to the webviews
+_amp_dirty = False
+_amp_timer_armed = False
+_amp_idle_ticks = 0
+# Main window only consumes amplitude during the onboarding mic test
+_onboarding_active = False
+
+
+def _flush_amplitude():
+    """Timer slot: deliver the latest amplitude frame if a new one arrived."""
+    global _amp_dirty, _amp_idle_ticks, _amp_timer_armed, _last_sent_amp
+    if not _amp_dirty:
+        _amp_idle_ticks += 1
+        if _amp_idle_ticks >= AMPLITUDE_IDLE_TICKS:
+            _amp_timer.stop()
+            _amp_timer_armed = False
+        return
+    _amp_dirty = False
+    _amp_idle_ticks = 0
+    data = _last_amp
+    if data == _last_sent_amp:
+        return  # e.g. silence after rounding — nothing new to draw
+    _last_sent_amp = data
     # Send to popup if it exists
     send_popup_event('amplitude', data)
     # Also send to main window (for onboarding mic test)
-    send_main_window_event('amplitude', data)
+    if _onboarding_active:
+        send_main_window_event('amplitude', data)
+
+def _on_amplitude_slot():
+    """Slot: audio frames started flowing - runs on main thread via signal."""
+    global _amp_idle_ticks
+    _amp_idle_ticks = 0
+    if not _amp_timer.isActive():
+        _amp_timer.start()
+    _flush_amplitude()
 
 def on_amplitude(data):
-    """Called from audio thread - emits signal to main Qt thread."""
-    if _signals:
-        _signals.amplitude_changed.emit(data)
+    """Called from audio thread - stashes the frame and arms the flush timer once."""
+    global _last_amp, _amp_dirty, _amp_timer_armed
+    _last_amp = data
+    _amp_dirty = True
+    if not _amp_timer_armed and _signals:
+        _amp_timer_armed = True
+        _signals.amplitude_pending.emit()
 
 
 def _on_visualizer_style_slot(style: str):
@@ -475,7 +734,8 @@ def _save_popup_pos():
         if pos.x() < -1000 or pos.y() < -1000:
             return
         controller.settings_service.save_popup_position(pos.x(), pos.y())
-        log.debug("Popup position saved", x=pos.x(), y=pos.y())
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug("Popup position saved", x=pos.x(), y=pos.y())
     except Exception as e:
         log.error("Failed to save popup position", error=str(e))
 
@@ -531,7 +791,6 @@ def _install_popup_drag_filter():
 # ---- Popup drag (Win32 native) ----
 def do_start_popup_drag():
     """Initiate native OS window drag via Win32 PostMessage."""
-    import sys
     if sys.platform != 'win32':
         return
     qw = _popup_qwindow()
@@ -549,25 +808,27 @@ def do_start_popup_drag():
 
 
 def on_onboarding_complete():
-    """Called when user completes onboarding - hide main window, show popup."""
-    global window
-    log.info("Onboarding complete - initializing popup")
+    """Called when user completes onboarding - hide main window."""
+    global window, _onboarding_active
+    log.info("Onboarding complete")
+    _onboarding_active = False
     # Hide the main window (user can reopen via tray)
-    if window:
-        window.hide()
-    # Initialize the popup directly (QTimer doesn't work reliably from async RPC context)
-    init_popup()
+    hide_main_window()
+    # The popup is created lazily on the first recording (see _on_recording_start_slot)
 
 
 def hide_popup():
     """Hide the popup window (used when returning to onboarding)."""
-    global popup_window
+    global popup_window, _popup_ready, _pending_popup_state, _popup_flags_set
     log.debug("Hiding popup window")
     if popup_window:
         try:
             popup_window.hide()
             popup_window.close()
             popup_window = None
+            _popup_ready = False
+            _popup_flags_set = False
+            _pending_popup_state = None
             log.info("Popup window hidden and destroyed")
         except Exception as e:
             log.error("Failed to hide popup", error=str(e))
@@ -575,13 +836,15 @@ def hide_popup():
 
 def on_data_reset():
     """Called when user resets all data - show main window, hide popup."""
-    global window
+    global window, _onboarding_active
     log.info("Data reset - returning to onboarding")
+    _onboarding_active = True
     # Hide the popup
     hide_popup()
     # Show the main window for onboarding
     if window:
         window.show()
+        _install_geo_filter()
         try:
             qwindow = window._window._window
             qwindow.showMaximized()
@@ -600,14 +863,24 @@ register_data_reset_callback(on_data_reset)
 register_download_progress_callback(send_download_progress)
 register_visualizer_style_callback(on_visualizer_style_changed)
 register_popup_drag_callback(do_start_popup_drag)
+register_popup_listening_callback(on_popup_listening)
 
 # Connect thread-safe signals to their slot handlers
 # Qt.QueuedConnection ensures slots run on the main thread
 _signals.recording_started.connect(_on_recording_start_slot, Qt.QueuedConnection)
 _signals.recording_stopped.connect(_on_recording_stop_slot, Qt.QueuedConnection)
 _signals.transcription_complete.connect(_on_transcription_complete_slot, Qt.QueuedConnection)
-_signals.amplitude_changed.connect(_on_amplitude_slot, Qt.QueuedConnection)
+_signals.amplitude_pending.connect(_on_amplitude_slot, Qt.QueuedConnection)
+_signals.error_occurred.connect(_on_error_slot, Qt.QueuedConnection)
+_signals.popup_listening.connect(_on_popup_listening_slot, Qt.QueuedConnection)
+
+# Amplitude flush timer lives on the main thread (see on_amplitude)
+_amp_timer = QTimer()
+_amp_timer.setInterval(AMPLITUDE_FLUSH_MS)
+_amp_timer.timeout.connect(_flush_amplitude)
 _signals.visualizer_style_changed.connect(_on_visualizer_style_slot, Qt.QueuedConnection)
+_signals.focus_requested.connect(show_dashboard, Qt.QueuedConnection)
+start_focus_listener()
 
 # Set UI callbacks
 controller.set_ui_callbacks(
@@ -615,6 +888,7 @@ controller.set_ui_callbacks(
     on_recording_stop=on_recording_stop,
     on_transcription_complete=on_transcription_complete,
     on_amplitude=on_amplitude,
+    on_error=on_error,
 )
 
 # Initialize controller (load model, start hotkey listener)
@@ -622,19 +896,42 @@ controller.initialize()
 
 
 # Check if onboarding is complete
-settings = controller.get_settings()
-onboarding_complete = settings.get("onboardingComplete", False)
+# Read settings once for the whole startup sequence (also used for window geometry)
+startup_settings = controller.settings_service.get_settings()
+onboarding_complete = startup_settings.onboarding_complete
+_onboarding_active = not onboarding_complete
 log.info("Startup", onboarding_complete=onboarding_complete)
 
 # Get Screen Info for main window
+init_screen_cache()
 get_screen_info()
 
 
 # Window Control Functions
-def minimize_main_window():
+# The geometry filter is only installed while the main window is visible, so a
+# window hidden in the tray doesn't route its events through Python.
+_geo_filter = None
+
+def _install_geo_filter():
+    if window and _geo_filter:
+        try:
+            window._window._window.installEventFilter(_geo_filter)
+        except Exception as e:
+            log.error("Failed to install geometry event filter", error=str(e))
+
+def hide_main_window():
+    """Hide the main window to the tray and detach the geometry filter."""
     if window:
+        if _geo_filter:
+            try:
+                window._window._window.removeEventFilter(_geo_filter)
+            except Exception as e:
+                log.error("Failed to remove geometry event filter", error=str(e))
         window.hide()
 
+def minimize_main_window():
+    hide_main_window()
+
 def toggle_maximize_main_window():
     if window:
         qwin = window._window._window
@@ -645,23 +942,21 @@ def toggle_maximize_main_window():
 
 def close_main_window():
     # Instead of quitting, we hide to tray if onboarding is done
-    if window:
-        window.hide()
+    hide_main_window()
 
 # Register these actions with the server so RPC can call them
 register_window_actions(minimize_main_window, toggle_maximize_main_window, close_main_window)
 
 
 # Main window setup
-if is_production():
-    url = pyloid_serve(directory=get_production_path("dist-front"))
+if _IS_PROD:
     # Revert to standard frame, no transparency to fix crash
     window = app.create_window(title="VoiceFlow", frame=True, transparent=False, dev_tools=False)
     # try:
     #     window._window.web_view.page().setBackgroundColor(QColor(0, 0, 0, 0))
     # except Exception as e:
     #     error(f"Failed to set transparent background: {e}")
-    window.load_url(url)
+    window.load_url(_FRONT_URL)
 else:
     # Dev: Standard Frame
     window = app.create_window(title="VoiceFlow", dev_tools=False, frame=True, transparent=False)
@@ -669,7 +964,7 @@ else:
     #     window._window.web_view.page().setBackgroundColor(QColor(0, 0, 0, 0)) 
     # except Exception as e:
     #     error(f"Failed to set transparent background: {e}")
-    window.load_url("http://localhost:5173")
+    window.load_url(_FRONT_URL)
 
 # Window sizing: set minimum, restore saved geometry or use 80% default
 MIN_WINDOW_WIDTH = 800
@@ -679,18 +974,14 @@ try:
     qwindow = window._window._window
     qwindow.setMinimumSize(MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT)
 
-    saved = controller.settings_service.get_settings()
+    saved = startup_settings
     restored = False
 
     if (saved.window_width is not None and saved.window_height is not None
             and saved.window_x is not None and saved.window_y is not None):
         # Validate the saved geometry is on an available screen
         saved_rect = QRect(saved.window_x, saved.window_y, saved.window_width, saved.window_height)
-        on_screen = any(
-            screen.geometry().intersects(saved_rect)
-            for screen in QApplication.instance().screens()
-        )
-        if on_screen:
+        if is_on_screen(saved_rect):
             w = max(saved.window_width, MIN_WINDOW_WIDTH)
             h = max(saved.window_height, MIN_WINDOW_HEIGHT)
             qwindow.resize(w, h)
@@ -708,25 +999,44 @@ except Exception as e:
     log.error("Failed to set window size constraints", error=str(e))
 
 
-# Debounced geometry saver — persists size/position 500ms after last change
+# Debounced geometry saver — captures size/position 500ms after the last change,
+# then writes it to the DB at most once per GEOMETRY_FLUSH_MS and on quit.
+GEOMETRY_FLUSH_MS = 5000
+_pending_geometry = None  # (width, height, x, y) not yet written
+
 _geometry_save_timer = QTimer()
 _geometry_save_timer.setSingleShot(True)
+_geometry_flush_timer = QTimer()
+_geometry_flush_timer.setSingleShot(True)
 
-def _save_geometry():
+def _capture_geometry():
+    global _pending_geometry
     try:
         qwin = window._window._window
         geo = qwin.geometry()
         # Only save when window is in a normal (non-minimized, non-maximized) state
         if not qwin.isMinimized() and not qwin.isMaximized():
-            controller.settings_service.save_window_geometry(
-                geo.width(), geo.height(), geo.x(), geo.y()
-            )
-            log.info("Window geometry saved", width=geo.width(), height=geo.height(),
-                     x=geo.x(), y=geo.y())
+            _pending_geometry = (geo.width(), geo.height(), geo.x(), geo.y())
+            if not _geometry_flush_timer.isActive():
+                _geometry_flush_timer.start(GEOMETRY_FLUSH_MS)
+    except Exception as e:
+        log.error("Failed to read window geometry", error=str(e))
+
+def _flush_geometry():
+    global _pending_geometry
+    if _pending_geometry is None:
+        return
+    width, height, x, y = _pending_geometry
+    _pending_geometry = None
+    try:
+        controller.settings_service.save_window_geometry(width, height, x, y)
+        log.info("Window geometry saved", width=width, height=height, x=x, y=y)
     except Exception as e:
         log.error("Failed to save window geometry", error=str(e))
 
-_geometry_save_timer.timeout.connect(_save_geometry)
+_geometry_save_timer.timeout.connect(_capture_geometry)
+_geometry_flush_timer.timeout.connect(_flush_geometry)
+QApplication.instance().aboutToQuit.connect(_flush_geometry)
 
 
 class WindowGeometryFilter(QObject):
@@ -738,25 +1048,21 @@ class WindowGeometryFilter(QObject):
         elif event.type() == QEvent.Type.WindowStateChange:
             if obj.isMinimized():
                 # Hide to tray instead of minimizing to taskbar
-                QTimer.singleShot(0, window.hide)
+                QTimer.singleShot(0, hide_main_window)
         return False
 
-try:
-    _geo_filter = WindowGeometryFilter()
-    window._window._window.installEventFilter(_geo_filter)
-except Exception as e:
-    log.error("Failed to install geometry event filter", error=str(e))
+_geo_filter = WindowGeometryFilter()
 
 
 if onboarding_complete:
     # Start minimized - user can open via tray icon
-    log.info("Onboarding already complete - hiding window and scheduling popup init")
+    # (popup is created lazily on the first recording)
+    log.info("Onboarding already complete - hiding window")
     window.hide()
-    # Initialize popup after a short delay
-    QTimer.singleShot(500, init_popup)
 else:
     # Show maximized for onboarding experience
     window.show()
+    _install_geo_filter()
     log.info("Showing onboarding window")
     # Don't initialize popup during onboarding
 
@@ -16,6 +16,7 @@ _on_data_reset = None
 _send_download_progress = None  # Callback to send progress to frontend
 _on_visualizer_style_changed = None  # Callback when user changes visualizer style
 _on_start_popup_drag = None           # Callback to initiate native window drag
+_on_popup_listening = None            # Callback when the popup page can receive events
 
 
 def register_visualizer_style_callback(callback):
@@ -29,6 +30,12 @@ def register_popup_drag_callback(callback):
     global _on_start_popup_drag
     _on_start_popup_drag = callback
 
+
+def register_popup_listening_callback(callback):
+    """Register callback to be called once the popup page has attached its listeners."""
+    global _on_popup_listening
+    _on_popup_listening = callback
+
 # Active download state
 _active_download_token: CancelToken = None
 _download_thread: threading.Thread = None
@@ -536,6 +543,14 @@ async def start_popup_drag():
     return {"success": True}
 
 
+@server.method()
+async def popup_listening():
+    """Popup page has attached its event listeners; queued popup state can be sent."""
+    if _on_popup_listening:
+        _on_popup_listening()
+    return {"success": True}
+
+
 @server.method()
 async def open_model_folder():
     """Open the HuggingFace model cache directory in the system file manager."""
@@ -1,9 +1,15 @@
-from .database import DatabaseService
-from .settings import SettingsService
-from .audio import AudioService
-from .transcription import TranscriptionService
-from .hotkey import HotkeyService
-from .clipboard import ClipboardService
+import importlib
+
+# Services are loaded on first attribute access (PEP 562) so importing a light
+# submodule like services.logger doesn't pull in faster-whisper or sounddevice.
+_LAZY = {
+    "DatabaseService": ".database",
+    "SettingsService": ".settings",
+    "AudioService": ".audio",
+    "TranscriptionService": ".transcription",
+    "HotkeyService": ".hotkey",
+    "ClipboardService": ".clipboard",
+}
 
 __all__ = [
     "DatabaseService",
@@ -13,3 +19,16 @@ __all__ = [
     "HotkeyService",
     "ClipboardService",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -4,39 +4,244 @@ import sounddevice as sd
 from typing import Optional, Callable
 import threading
 import queue
+import time
 from services.logger import get_logger
 
 log = get_logger("audio")
 
+_rfft = None  # resolved by _get_rfft() on first visualizer use
+
+
+def _get_rfft():
+    """scipy's pocketfft if installed (faster for small real transforms), else numpy.
+
+    Imported lazily on the visualizer worker: scipy.fft costs ~150ms to import,
+    which would otherwise land on app startup.
+    """
+    global _rfft
+    if _rfft is None:
+        try:
+            from scipy.fft import rfft
+        except ImportError:
+            rfft = np.fft.rfft
+        _rfft = rfft
+    return _rfft
+
+
 N_BANDS = 20       # Frequency bands for spectrum visualizer
 F_MIN   = 80       # Hz — low end of voice range
 F_MAX   = 3500     # Hz — upper end of voiced speech (formants F1-F3)
+VIZ_SLOTS = 8      # Blocks buffered between the audio thread and the visualizer worker
+VIZ_POINTS = 64    # Waveform points sent to the frontend per block
+VIZ_EMIT_INTERVAL = 1 / 30  # Seconds; minimum spacing of visualizer callbacks
+# Default PCM buffer capacity (30 min); audio past this is dropped. The buffer is
+# reserved up front but only the pages the longest recording touched are resident,
+# so memory scales with the longest recording (32 KB/s), not with this cap.
+MAX_RECORD_SECONDS = 1800
+INT16_SCALE = np.float32(1.0 / 32768)  # int16 PCM -> float32 in [-1, 1)
+DEVICE_CACHE_TTL = 2.0  # Seconds a device enumeration is reused
+
+# Visualizer calibration: log-compression gain and EMA attack/decay weights
+AMP_GAIN = 120
+AMP_ATTACK = 0.80
+AMP_DECAY = 0.45
+AMP_LOG_NORM = math.log1p(AMP_GAIN)
+BAND_GAIN = 220
+BAND_ATTACK = 0.92
+BAND_DECAY = 0.45
+BAND_LOG_NORM = math.log1p(BAND_GAIN)
+
+
+# Exact argument types AudioService passes to the JIT kernel
+_PROCESS_CHUNK_SIG = (
+    "float64(float32[::1], float32[::1], float64, int32[::1], int32[::1], float32[::1], "
+    "float64[::1], float64, float64[::1], float64[::1])"
+)
+
+# Optional numba + rocket-fft build of _process_chunk (the "dsp" extra). Built by
+# _load_jit_kernel() on a background thread; None until then, or if unavailable,
+# in which case the visualizer uses the NumPy path.
+_jit_kernel = None
+_jit_attempted = False
+_jit_lock = threading.Lock()
+
+
+def _load_jit_kernel():
+    """Import numba and compile the visualizer kernel, once per process.
+
+    Slow (numba + rocket-fft import ~200ms, compile ~2s cold or ~1s from the
+    on-disk cache), so only call it from a background thread.
+    """
+    global _jit_kernel, _jit_attempted
+    with _jit_lock:
+        if _jit_attempted:
+            return
+        _jit_attempted = True
+
+    try:
+        import numba
+        import rocket_fft  # noqa: F401  (registers np.fft support inside numba)
+    except ImportError:
+        log.debug("numba/rocket-fft not installed, visualizer uses NumPy")
+        return
+
+    try:
+        try:
+            # numba caches next to this file, or in the per-user cache dir for
+            # frozen builds; NUMBA_CACHE_DIR pins the location
+            kernel = numba.njit(cache=True, fastmath=True, boundscheck=False)(_process_chunk)
+        except RuntimeError as e:
+            # No writable cache location: the kernel is recompiled on every launch
+            log.warning("numba cache unavailable, set NUMBA_CACHE_DIR to a writable dir",
+                        error=str(e))
+            kernel = numba.njit(fastmath=True, boundscheck=False)(_process_chunk)
+        kernel.compile(_PROCESS_CHUNK_SIG)
+    except Exception as e:
+        log.warning("JIT visualizer kernel unavailable, using NumPy", error=str(e))
+        return
+
+    _jit_kernel = kernel
+    log.debug("JIT visualizer kernel ready")
+
+
+def _start_jit_kernel_build():
+    """Run _load_jit_kernel on a daemon thread unless it has already been tried."""
+    if not _jit_attempted:
+        threading.Thread(target=_load_jit_kernel, name="viz-jit", daemon=True).start()
+
+
+def _drop_jit_kernel(e: Exception):
+    """Fall back to the NumPy path for the rest of the process."""
+    global _jit_kernel
+    log.warning("JIT visualizer kernel failed, using NumPy", error=str(e))
+    _jit_kernel = None
+
+
+def _process_chunk(audio, window, pow_scale, band_lo, band_hi, band_inv_width,
+                   smoothed_bands, smoothed_amp, out, samples):
+    """Fused visualizer DSP for one block, same math as the NumPy path.
+
+    Writes [amplitude, *bands] into out and the waveform into samples,
+    updates smoothed_bands in place and returns the new smoothed amplitude.
+    audio is windowed in place, so it must be a scratch buffer.
+    """
+    n = audio.size
+
+    acc = 0.0
+    for i in range(n):
+        acc += audio[i] * audio[i]
+    raw_amp = min(1.0, math.log1p(math.sqrt(acc / n) * AMP_GAIN) / AMP_LOG_NORM)
+    # Branchless asymmetric EMA: the comparison selects attack vs decay weight
+    diff = raw_amp - smoothed_amp
+    smoothed_amp += (AMP_DECAY + (AMP_ATTACK - AMP_DECAY) * (diff > 0.0)) * diff
+    out[0] = smoothed_amp
+
+    step = n // samples.size
+    for j in range(samples.size):
+        acc = 0.0
+        for i in range(j * step, (j + 1) * step):
+            acc += audio[i]
+        samples[j] = acc / step
+
+    for i in range(n):
+        audio[i] *= window[i]
+    spectrum = np.fft.rfft(audio)
+    # N_BANDS is a compile-time constant, so this loop has a fixed trip count
+    for b in range(N_BANDS):
+        acc = 0.0
+        for k in range(band_lo[b], band_hi[b]):
+            acc += spectrum[k].real * spectrum[k].real + spectrum[k].imag * spectrum[k].imag
+        band_mag = math.sqrt(acc * pow_scale * band_inv_width[b])
+        raw = min(1.0, math.log1p(band_mag * BAND_GAIN) / BAND_LOG_NORM)
+        diff = raw - smoothed_bands[b]
+        smoothed_bands[b] += (BAND_DECAY + (BAND_ATTACK - BAND_DECAY) * (diff > 0.0)) * diff
+        out[1 + b] = smoothed_bands[b]
+
+    return smoothed_amp
+
+
+class _VizSession:
+    """Visualizer state for one recording, owned by that recording's worker thread.
+
+    Every recording gets a fresh session (zeroed smoothing, its own slot ring and
+    scratch buffers), so a worker still finishing an old session never shares
+    memory with the next one and stop_recording has nothing to wait for or reset.
+    """
+
+    def __init__(self, chunk_size: int, capture_dtype):
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.stopped = threading.Event()
+        # The audio callback copies each block into a slot and queues the index
+        self.ring = np.zeros((VIZ_SLOTS, chunk_size), dtype=capture_dtype)
+        self.slot = 0
+        # Worker-side float32 copy of the current slot; windowed in place by the DSP
+        self.block = np.empty(chunk_size, dtype=np.float32)
+        self.smoothed_amplitude = 0.0
+        self.smoothed_bands = np.zeros(N_BANDS, dtype=np.float64)
+        # Reused FFT power buffer
+        self.pow = np.empty(chunk_size // 2 + 1, dtype=np.float32)
+        # Scratch buffers for the in-place band levels and EMA
+        self.band_raw = np.empty(N_BANDS, dtype=np.float64)
+        self.ema_rising = np.empty(N_BANDS, dtype=bool)
+        self.ema_alpha = np.empty(N_BANDS, dtype=np.float64)
+        self.ema_delta = np.empty(N_BANDS, dtype=np.float64)
+        # Output buffers: [amplitude, *bands] and the 64-point waveform.
+        # float64 so tolist() yields clean rounded numbers for the JSON bridge.
+        self.out = np.empty(1 + N_BANDS, dtype=np.float64)
+        self.samples = np.empty(VIZ_POINTS, dtype=np.float64)
 
 
 class AudioService:
     SAMPLE_RATE = 16000  # Whisper expects 16kHz
     CHUNK_SIZE  = 1024
     CHANNELS    = 1
-    DTYPE       = np.float32
+    DTYPE       = np.float32  # Returned to Whisper
+    CAPTURE_DTYPE = np.int16  # What PortAudio delivers and the rings store
 
-    def __init__(self):
+    # (monotonic timestamp, input devices) from the last PortAudio enumeration
+    _device_cache: tuple = (0.0, [])
+
+    def __init__(self, max_record_seconds: int = MAX_RECORD_SECONDS):
         self._recording = False
-        self._audio_queue = queue.Queue()
-        self._audio_data = []
-        self._stream: Optional[sd.InputStream] = None
+        self._stream: Optional[sd.RawInputStream] = None
         self._amplitude_callback: Optional[Callable[[list], None]] = None
         self._device_id: Optional[int] = None  # None = default device
-        self._smoothed_amplitude: float = 0.0
 
-        # Pre-compute log-spaced frequency band bin ranges for the FFT
-        freqs = np.fft.rfftfreq(self.CHUNK_SIZE, 1.0 / self.SAMPLE_RATE)
+        # Captured PCM: a linear int16 buffer the audio callback fills at the
+        # running offset _write_off; stop_recording reads back [:_write_off].
+        # Allocated on the first recording and reused for every later one. Each
+        # recording starts again at offset 0, so only the pages the longest
+        # recording has touched are ever resident.
+        self._max_record_seconds = max_record_seconds
+        self._pcm_buffer: Optional[np.ndarray] = None
+        self._write_off = 0
+        self._overflowed = False
+
+        # Pre-compute log-spaced frequency band bin ranges for the FFT.
+        # rfftfreq(N, 1/SR)[k] == k*SR/N, so the first bin at or above a band
+        # edge f is ceil(f*N/SR); hi is capped at Nyquist and kept above lo.
+        nyquist_bin = self.CHUNK_SIZE // 2
         band_edges = np.logspace(np.log10(F_MIN), np.log10(F_MAX), N_BANDS + 1)
-        self._band_bins: list = []
-        for i in range(N_BANDS):
-            lo = int(np.searchsorted(freqs, band_edges[i]))
-            hi = int(np.searchsorted(freqs, band_edges[i + 1]))
-            self._band_bins.append((lo, max(lo + 1, min(hi, len(freqs) - 1))))
-        self._smoothed_bands = np.zeros(N_BANDS, dtype=np.float64)
+        edge_bins = np.ceil(band_edges * self.CHUNK_SIZE / self.SAMPLE_RATE).astype(np.int32)
+        band_lo = edge_bins[:-1]
+        band_hi = np.maximum(band_lo + 1, np.minimum(edge_bins[1:], nyquist_bin))
+        # Interleaved [lo0, hi0, lo1, hi1, ...] so one np.add.reduceat sums every band
+        self._band_idx = np.column_stack((band_lo, band_hi)).ravel()
+        # Fixed band layout shared by both DSP paths: int32 [lo, hi) bin ranges
+        # and reciprocal widths, so averaging a band is a multiply
+        self._band_lo = band_lo
+        self._band_hi = band_hi
+        self._band_inv_width = (1.0 / (band_hi - band_lo)).astype(np.float32)
+        # Hann window against spectral leakage. Magnitudes are scaled by
+        # 2 / (N * rms(window)) so band levels stay comparable to an unwindowed FFT;
+        # the spectrum is kept as power, hence the square.
+        self._window = np.hanning(self.CHUNK_SIZE).astype(np.float32)
+        window_rms = math.sqrt(float(np.mean(np.square(self._window, dtype=np.float64))))
+        self._pow_scale = (2.0 / (self.CHUNK_SIZE * window_rms)) ** 2
+
+        # Visualizer DSP runs on a per-recording worker thread (see _VizSession);
+        # the audio callback only copies blocks into the session's slot ring.
+        self._viz: Optional[_VizSession] = None
 
     def set_device(self, device_id: Optional[int]):
         """Set the input device to use. None for default."""
@@ -52,68 +257,196 @@ class AudioService:
             log.warning("Audio status warning", status=str(status))
 
         try:
-            self._process_audio_chunk(indata)
+            # RawInputStream hands us a bare buffer; view it without copying.
+            # CHANNELS == 1, so the interleaved buffer is already mono.
+            mono = np.frombuffer(indata, dtype=self.CAPTURE_DTYPE, count=frames)
+            self._process_audio_chunk(mono)
         except Exception as e:
             log.error("Audio callback error", error=str(e))
 
-    def _process_audio_chunk(self, indata):
-        # Copy audio data
-        audio_chunk = indata.copy().flatten()
-        self._audio_queue.put(audio_chunk)
-
-        if self._amplitude_callback:
-            # --- Overall amplitude (for glow / container brightness) ---
-            rms = float(np.sqrt(np.mean(audio_chunk ** 2)))
-            raw_amp = min(1.0, math.log1p(rms * 120) / math.log1p(120))
-            a = 0.80 if raw_amp > self._smoothed_amplitude else 0.45
-            self._smoothed_amplitude = a * raw_amp + (1 - a) * self._smoothed_amplitude
-
-            # --- Spectrum bands via FFT ---
-            # Normalize magnitudes by chunk size so values are independent of N
-            fft_mag = np.abs(np.fft.rfft(audio_chunk)) / (self.CHUNK_SIZE / 2)
-            raw_bands = np.zeros(N_BANDS, dtype=np.float64)
-            for i, (lo, hi) in enumerate(self._band_bins):
-                band_mag = float(np.mean(fft_mag[lo:hi]))
-                raw_bands[i] = min(1.0, math.log1p(band_mag * 220) / math.log1p(220))
-
-            # Per-band EMA: fast attack, moderate decay for dynamic response
-            alpha = np.where(raw_bands > self._smoothed_bands, 0.92, 0.45)
-            self._smoothed_bands = alpha * raw_bands + (1 - alpha) * self._smoothed_bands
-
-            # Downsample 1024 samples → 64 points (avg blocks of 16)
-            chunk = audio_chunk[:1024]
-            if len(chunk) >= 64:
-                samples_ds = chunk[:64 * 16].reshape(64, 16).mean(axis=1)
-                samples = [round(float(v), 4) for v in samples_ds]
-            else:
-                samples = [0.0] * 64
-
-            data = {
-                "amplitude": round(self._smoothed_amplitude, 3),
-                "bands": [round(float(v), 3) for v in self._smoothed_bands],
-                "samples": samples,
-            }
-            self._amplitude_callback(data)
+    def _process_audio_chunk(self, mono):
+        self._pcm_write(mono)
+
+        viz = self._viz
+        if self._amplitude_callback and viz is not None:
+            # Hand the block to the visualizer worker. If it falls VIZ_SLOTS blocks
+            # behind, the oldest slot is overwritten — acceptable for a visualizer.
+            slot = viz.slot
+            viz.slot = (slot + 1) % VIZ_SLOTS
+            row = viz.ring[slot]
+            frames = min(len(mono), self.CHUNK_SIZE)
+            np.copyto(row[:frames], mono[:frames])
+            if frames < self.CHUNK_SIZE:
+                # Short block: zero-pad so the DSP always sees a full CHUNK_SIZE window
+                row[frames:] = 0
+            viz.queue.put_nowait(slot)
+
+    def _pcm_write(self, samples):
+        """Append a block to the PCM buffer (audio thread). No locks, no allocation."""
+        start = self._write_off
+        end = start + len(samples)
+        if end > len(self._pcm_buffer):
+            if not self._overflowed:
+                self._overflowed = True
+                log.warning("Recording exceeds capture buffer, dropping audio",
+                            max_seconds=self._max_record_seconds)
+            return
+        np.copyto(self._pcm_buffer[start:end], samples)
+        self._write_off = end
+
+    def _pcm_read_all(self) -> np.ndarray:
+        """Return the current recording as one contiguous float32 array.
+
+        The int16 -> float32 conversion writes straight into the result, so
+        there is no intermediate int16 copy.
+        """
+        audio = np.empty(self._write_off, dtype=self.DTYPE)
+        np.multiply(self._pcm_buffer[:self._write_off], INT16_SCALE, out=audio)
+        return audio
+
+    def _viz_worker(self, viz: _VizSession):
+        """Visualizer thread: run the DSP for each queued block until a None sentinel.
+
+        Once the session is stopped, remaining blocks are drained unprocessed.
+        The session and its smoothing state are dropped with the thread.
+        """
+        last_emit = 0.0
+        while True:
+            slot = viz.queue.get()
+            if slot is None:
+                return
+            if viz.stopped.is_set():
+                continue
+            # Every block feeds the smoothing state, but when catching up on a
+            # backlog only emit at VIZ_EMIT_INTERVAL (and always the newest block).
+            now = time.monotonic()
+            emit = viz.queue.empty() or now - last_emit >= VIZ_EMIT_INTERVAL
+            try:
+                np.multiply(viz.ring[slot], INT16_SCALE, out=viz.block)
+                self._process_viz_block(viz, viz.block, emit)
+            except Exception as e:
+                log.error("Visualizer processing error", error=str(e))
+            if emit:
+                last_emit = now
+
+    def _process_viz_block(self, viz: _VizSession, audio_chunk, emit: bool = True):
+        if not self._amplitude_callback:
+            return
+
+        kernel = _jit_kernel
+        if kernel is not None:
+            # Already compiled by _load_jit_kernel; until then the NumPy path runs
+            try:
+                viz.smoothed_amplitude = kernel(
+                    audio_chunk, self._window, self._pow_scale,
+                    self._band_lo, self._band_hi, self._band_inv_width,
+                    viz.smoothed_bands, viz.smoothed_amplitude,
+                    viz.out, viz.samples,
+                )
+            except Exception as e:
+                _drop_jit_kernel(e)
+                self._process_viz_numpy(viz, audio_chunk)
+        else:
+            self._process_viz_numpy(viz, audio_chunk)
+
+        # Skip intermediate frames, and never emit after stop_recording returned
+        if not emit or viz.stopped.is_set():
+            return
+
+        # Round amplitude + bands and the waveform in vectorized calls
+        out = viz.out
+        np.round(out, 3, out=out)
+        np.round(viz.samples, 4, out=viz.samples)
+        values = out.tolist()
+
+        data = {
+            "amplitude": values[0],
+            "bands": values[1:],
+            "samples": viz.samples.tolist(),
+        }
+        self._amplitude_callback(data)
+
+    def _process_viz_numpy(self, viz: _VizSession, audio_chunk):
+        """Pure-NumPy visualizer DSP; fills viz.out and viz.samples unrounded.
+
+        audio_chunk is windowed in place, so it must be a scratch buffer.
+        """
+        # --- Overall amplitude (for glow / container brightness) ---
+        # Dot product = sum of squares in one pass, no squared temp buffer
+        rms = math.sqrt(float(np.dot(audio_chunk, audio_chunk)) / audio_chunk.size)
+        raw_amp = min(1.0, math.log1p(rms * AMP_GAIN) / AMP_LOG_NORM)
+        # Asymmetric EMA, same branchless form as the numba kernel
+        diff = raw_amp - viz.smoothed_amplitude
+        viz.smoothed_amplitude += (AMP_DECAY + (AMP_ATTACK - AMP_DECAY) * (diff > 0.0)) * diff
+
+        # Downsample the block to VIZ_POINTS (average of equal-width runs).
+        # Done before windowing, which overwrites audio_chunk.
+        step = audio_chunk.size // VIZ_POINTS
+        np.mean(audio_chunk[:VIZ_POINTS * step].reshape(VIZ_POINTS, step), axis=1,
+                out=viz.samples)
+
+        # --- Spectrum bands via windowed FFT ---
+        # One 1024-point transform: 512-point Welch segments would give 31 Hz bins
+        # (merging the lowest bands) and cost more than a single FFT at this size.
+        np.multiply(audio_chunk, self._window, out=audio_chunk)
+        spec = _get_rfft()(audio_chunk)
+        # Power without a per-bin sqrt: square the interleaved re/im pairs of the
+        # (freshly allocated) spectrum in place, then add each pair
+        parts = spec.view(spec.real.dtype)
+        np.square(parts, out=parts)
+        fft_pow = np.add(parts[0::2], parts[1::2], out=viz.pow)
+        fft_pow *= self._pow_scale
+        # Even reduceat slots are the [lo, hi) band sums; odd slots span the gaps.
+        # sqrt of the mean band power (band RMS magnitude) keeps the gain calibration.
+        # The level chain then runs in place as whole-array ufuncs on one buffer.
+        raw_bands = viz.band_raw
+        np.multiply(np.add.reduceat(fft_pow, self._band_idx)[::2], self._band_inv_width, out=raw_bands)
+        np.sqrt(raw_bands, out=raw_bands)
+        raw_bands *= BAND_GAIN
+        np.log1p(raw_bands, out=raw_bands)
+        raw_bands /= BAND_LOG_NORM
+        np.minimum(raw_bands, 1.0, out=raw_bands)
+
+        # Per-band EMA: fast attack, moderate decay for dynamic response.
+        # Written as smoothed += alpha * (raw - smoothed), in place.
+        np.greater(raw_bands, viz.smoothed_bands, out=viz.ema_rising)
+        viz.ema_alpha.fill(BAND_DECAY)
+        np.copyto(viz.ema_alpha, BAND_ATTACK, where=viz.ema_rising)
+        np.subtract(raw_bands, viz.smoothed_bands, out=viz.ema_delta)
+        viz.ema_delta *= viz.ema_alpha
+        viz.smoothed_bands += viz.ema_delta
+
+        viz.out[0] = viz.smoothed_amplitude
+        viz.out[1:] = viz.smoothed_bands
 
     def start_recording(self):
         if self._recording:
             return
 
         self._recording = True
-        self._audio_data = []
 
-        # Clear queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        if self._pcm_buffer is None:
+            self._pcm_buffer = np.empty(self._max_record_seconds * self.SAMPLE_RATE,
+                                        dtype=self.CAPTURE_DTYPE)
+
+        # Start at the front of the buffer, over the previous recording's pages
+        self._write_off = 0
+        self._overflowed = False
+
+        # Build the JIT kernel on first use rather than at app startup; the
+        # NumPy path drives the visualizer until it is ready
+        _start_jit_kernel_build()
+
+        # Start this recording's visualizer worker before audio starts flowing
+        viz = _VizSession(self.CHUNK_SIZE, self.CAPTURE_DTYPE)
+        threading.Thread(target=self._viz_worker, args=(viz,), daemon=True).start()
+        self._viz = viz
 
         log.info("Starting recording", device_id=self._device_id)
-        self._stream = sd.InputStream(
+        self._stream = sd.RawInputStream(
             samplerate=self.SAMPLE_RATE,
             channels=self.CHANNELS,
-            dtype=self.DTYPE,
+            dtype=self.CAPTURE_DTYPE,
             callback=self._audio_callback,
             blocksize=self.CHUNK_SIZE,
             device=self._device_id,
@@ -126,37 +459,46 @@ class AudioService:
             return np.array([], dtype=self.DTYPE)
 
         self._recording = False
-        self._smoothed_amplitude = 0.0
-        self._smoothed_bands[:] = 0.0
 
         if self._stream:
             self._stream.stop()
             self._stream.close()
             self._stream = None
 
-        # Collect all audio from queue
-        while not self._audio_queue.empty():
-            try:
-                chunk = self._audio_queue.get_nowait()
-                self._audio_data.append(chunk)
-            except queue.Empty:
-                break
+        # Retire the visualizer session without waiting on it: the worker may be
+        # busy (e.g. behind a JIT compile), but it owns all of its state, stops
+        # emitting as soon as it sees the flag and exits at the sentinel. The
+        # next recording starts from a fresh session.
+        viz = self._viz
+        self._viz = None
+        if viz is not None:
+            viz.stopped.set()
+            viz.queue.put(None)
 
-        if not self._audio_data:
+        # Stream is stopped, so the producer is done — collect the recording
+        if self._write_off == 0:
             return np.array([], dtype=self.DTYPE)
 
-        # Concatenate all chunks
-        audio = np.concatenate(self._audio_data)
-        self._audio_data = []
-
-        return audio
+        return self._pcm_read_all()
 
     def is_recording(self) -> bool:
         return self._recording
 
-    @staticmethod
-    def get_input_devices() -> list:
-        """Get list of available input devices."""
+    def was_truncated(self) -> bool:
+        """True if the last recording outgrew the capture buffer and lost its tail."""
+        return self._overflowed
+
+    @classmethod
+    def get_input_devices(cls) -> list:
+        """Get list of available input devices.
+
+        Enumeration goes through the host API and can take tens of ms, so the
+        result is reused for DEVICE_CACHE_TTL seconds.
+        """
+        cached_at, cached = cls._device_cache
+        if cached_at and time.monotonic() - cached_at < DEVICE_CACHE_TTL:
+            return list(cached)
+
         devices = sd.query_devices()
         input_devices = []
         for i, device in enumerate(devices):
@@ -166,4 +508,10 @@ class AudioService:
                     'name': device['name'],
                     'channels': device['max_input_channels'],
                 })
-        return input_devices
+        cls._device_cache = (time.monotonic(), input_devices)
+        return list(input_devices)
+
+    @classmethod
+    def invalidate_device_cache(cls):
+        """Force the next get_input_devices() call to re-enumerate devices."""
+        cls._device_cache = (0.0, [])
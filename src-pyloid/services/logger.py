@@ -101,6 +101,15 @@ class DomainLogger:
 
         self._logger.log(level, message, extra=extra)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Return True if messages at this level would be emitted.
+
+        Use on hot paths to skip building structured kwargs for disabled levels:
+            if log.is_enabled_for(logging.DEBUG):
+                log.debug("Frame sent", size=len(frame))
+        """
+        return self._logger.isEnabledFor(level)
+
     def debug(self, message: str, **kwargs):
         """Log a debug message."""
         self._log(logging.DEBUG, message, **kwargs)
@@ -1,11 +1,13 @@
 import numpy as np
-from typing import Optional
-from faster_whisper import WhisperModel
+from typing import Optional, TYPE_CHECKING
 import threading
 from services.logger import get_logger
 from services.model_manager import MODEL_REPOS
 from services.gpu import resolve_device, get_compute_type
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 log = get_logger("model")
 
 
@@ -16,7 +18,7 @@ def _get_repo_id(model_name: str) -> str:
 
 class TranscriptionService:
     def __init__(self):
-        self._model: Optional[WhisperModel] = None
+        self._model: Optional["WhisperModel"] = None
         self._current_model_name: str = None
         self._current_device: str = None
         self._current_compute_type: str = None
@@ -30,6 +32,10 @@ class TranscriptionService:
             model_name: Name of the Whisper model
             device_preference: "auto", "cpu", or "cuda"
         """
+        # Imported here so the (slow) faster-whisper/ctranslate2 import happens on
+        # the model-loading thread instead of at app startup
+        from faster_whisper import WhisperModel
+
         # Resolve device and compute type
         device = resolve_device(device_preference)
         compute_type = get_compute_type(device)
@@ -1,5 +1,8 @@
+import threading
 import pytest
 import numpy as np
+from unittest.mock import patch
+from services import audio as audio_module
 from services.audio import AudioService
 
 
@@ -99,3 +102,153 @@ class TestAudioService:
             assert "id" in device
             assert "name" in device
             assert "channels" in device
+
+    def test_get_input_devices_is_cached_until_invalidated(self):
+        """Device enumeration is reused until the cache is invalidated."""
+        fake_devices = [
+            {"name": "Mic", "max_input_channels": 1},
+            {"name": "Speakers", "max_input_channels": 0},
+        ]
+        AudioService.invalidate_device_cache()
+        with patch("services.audio.sd.query_devices", return_value=fake_devices) as query:
+            first = AudioService.get_input_devices()
+            second = AudioService.get_input_devices()
+            assert query.call_count == 1
+            assert first == second == [{"id": 0, "name": "Mic", "channels": 1}]
+
+            AudioService.invalidate_device_cache()
+            AudioService.get_input_devices()
+            assert query.call_count == 2
+
+        AudioService.invalidate_device_cache()
+
+
+def _feed(service, blocks):
+    """Push int16 blocks through the audio callback as raw bytes, like sd.RawInputStream."""
+    for block in blocks:
+        service._audio_callback(block.tobytes(), len(block), None, None)
+
+
+class TestCaptureBuffer:
+    def _blocks(self, rng, count):
+        return [
+            rng.integers(-32768, 32768, AudioService.CHUNK_SIZE, dtype=np.int16)
+            for _ in range(count)
+        ]
+
+    def test_each_recording_starts_at_offset_zero(self):
+        """Every recording reuses the front of the buffer instead of advancing through it."""
+        service = AudioService(max_record_seconds=1)
+        rng = np.random.default_rng(0)
+        with patch("services.audio.sd.RawInputStream"):
+            # 10 blocks per recording; three of them would not fit back to back
+            for _ in range(3):
+                blocks = self._blocks(rng, 10)
+                service.start_recording()
+                assert service._write_off == 0
+                _feed(service, blocks)
+                audio = service.stop_recording()
+
+                expected = np.concatenate(blocks)
+                np.testing.assert_array_equal(service._pcm_buffer[:len(expected)], expected)
+                np.testing.assert_array_equal(audio, expected.astype(np.float32) / 32768)
+                assert service.was_truncated() is False
+
+    def test_overflow_keeps_head_and_reports_truncation(self):
+        """Audio past the buffer capacity is dropped and flagged until the next recording."""
+        service = AudioService(max_record_seconds=1)
+        rng = np.random.default_rng(1)
+        blocks = self._blocks(rng, 20)
+        with patch("services.audio.sd.RawInputStream"):
+            service.start_recording()
+            _feed(service, blocks)
+            audio = service.stop_recording()
+
+            # Whole blocks fit until the next one would exceed the 16000-sample buffer
+            kept = AudioService.SAMPLE_RATE // AudioService.CHUNK_SIZE
+            expected = np.concatenate(blocks[:kept]).astype(np.float32) / 32768
+            np.testing.assert_array_equal(audio, expected)
+            assert service.was_truncated() is True
+
+            service.start_recording()
+            assert service.was_truncated() is False
+            service.stop_recording()
+
+    def test_int16_capture_is_scaled_to_float32(self):
+        """int16 capture is returned as float32 in [-1, 1), the format Whisper expects."""
+        service = AudioService()
+        block = np.zeros(AudioService.CHUNK_SIZE, dtype=np.int16)
+        block[:5] = [-32768, -16384, 0, 16384, 32767]
+        with patch("services.audio.sd.RawInputStream"):
+            service.start_recording()
+            _feed(service, [block])
+            audio = service._pcm_read_all()
+            service.stop_recording()
+
+        assert audio.dtype == np.float32
+        assert audio.shape == (AudioService.CHUNK_SIZE,)
+        assert audio[:5].tolist() == [-1.0, -0.5, 0.0, 0.5, 32767 / 32768]
+
+
+class TestVisualizerDsp:
+    def _run(self, service, signal):
+        """Feed signal through one visualizer session and collect every emitted frame."""
+        frames = []
+        service.set_amplitude_callback(frames.append)
+        viz = audio_module._VizSession(AudioService.CHUNK_SIZE, AudioService.CAPTURE_DTYPE)
+        for start in range(0, len(signal), AudioService.CHUNK_SIZE):
+            # The DSP windows its input in place, so hand it a copy
+            service._process_viz_block(viz, signal[start:start + AudioService.CHUNK_SIZE].copy())
+        return frames
+
+    def test_jit_kernel_matches_numpy_path(self, monkeypatch):
+        """The numba kernel and the NumPy fallback produce the same visualizer frames."""
+        pytest.importorskip("numba")
+        # start_recording in earlier tests may already be building it in the background
+        for thread in threading.enumerate():
+            if thread.name == "viz-jit":
+                thread.join()
+        audio_module._load_jit_kernel()
+        kernel = audio_module._jit_kernel
+        if kernel is None:
+            pytest.skip("JIT kernel failed to build")
+
+        # A tone with noise, then a quiet tail so both attack and decay are exercised
+        rng = np.random.default_rng(2)
+        t = np.arange(AudioService.CHUNK_SIZE * 40) / AudioService.SAMPLE_RATE
+        signal = (0.3 * np.sin(2 * np.pi * 440 * t)
+                  + 0.05 * rng.standard_normal(t.size)).astype(np.float32)
+        signal[AudioService.CHUNK_SIZE * 20:] *= 0.05
+
+        service = AudioService()
+        jit_frames = self._run(service, signal)
+        monkeypatch.setattr(audio_module, "_jit_kernel", None)
+        numpy_frames = self._run(service, signal)
+
+        assert len(jit_frames) == len(numpy_frames) == 40
+        for key in ("amplitude", "bands", "samples"):
+            np.testing.assert_allclose(
+                [frame[key] for frame in jit_frames],
+                [frame[key] for frame in numpy_frames],
+                atol=1e-3,
+            )
+
+    @pytest.mark.parametrize("chunk_size", [512, 1024, 2048])
+    @pytest.mark.parametrize("sample_rate", [16000, 44100, 48000])
+    def test_band_bins_match_searchsorted_layout(self, chunk_size, sample_rate):
+        """Closed-form band bins reproduce the original rfftfreq/searchsorted layout."""
+        service_cls = type("Service", (AudioService,),
+                           {"CHUNK_SIZE": chunk_size, "SAMPLE_RATE": sample_rate})
+        service = service_cls()
+
+        freqs = np.fft.rfftfreq(chunk_size, 1.0 / sample_rate)
+        band_edges = np.logspace(np.log10(audio_module.F_MIN), np.log10(audio_module.F_MAX),
+                                 audio_module.N_BANDS + 1)
+        expected = []
+        for i in range(audio_module.N_BANDS):
+            lo = int(np.searchsorted(freqs, band_edges[i]))
+            hi = int(np.searchsorted(freqs, band_edges[i + 1]))
+            expected.append((lo, max(lo + 1, min(hi, len(freqs) - 1))))
+
+        assert list(zip(service._band_lo.tolist(), service._band_hi.tolist())) == expected
+        assert service._band_lo.dtype == service._band_hi.dtype == np.int32
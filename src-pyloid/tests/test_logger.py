@@ -303,6 +303,21 @@ class TestDomainLoggerInterface:
         assert "retention" in content
 
 
+    def test_is_enabled_for_follows_logger_level(self, temp_log_dir):
+        """is_enabled_for() reflects the underlying logger level."""
+        import logging
+        from services.logger import get_logger, setup_logging
+
+        setup_logging(temp_log_dir / "VoiceFlow.log")
+
+        log = get_logger("window")
+        assert log.is_enabled_for(logging.DEBUG)
+
+        logging.getLogger("VoiceFlow.window").setLevel(logging.INFO)
+        assert not log.is_enabled_for(logging.DEBUG)
+        assert log.is_enabled_for(logging.INFO)
+
+
 class TestLoggerReset:
     """Tests for logger reset functionality (for testing isolation)."""
 
@@ -135,6 +135,11 @@ export const api = {
     return rpc.call("start_popup_drag");
   },
 
+  // Popup event listeners attached; backend flushes any queued popup state
+  async popupListening(): Promise<{ success: boolean }> {
+    return rpc.call("popup_listening");
+  },
+
   // Model storage
   async getModelStorageInfo(): Promise<ModelStorageInfo> {
     return rpc.call("get_model_storage_info");
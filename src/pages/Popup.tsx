@@ -958,6 +958,8 @@ export function Popup() {
     document.addEventListener("amplitude" as any, handleAmplitude);
     document.addEventListener("popup-state" as any, handleState);
     document.addEventListener("visualizer-style" as any, handleStyle);
+    // Only now can popup-state events be received; loadFinished alone is too early
+    api.popupListening().catch(() => {});
     return () => {
       document.removeEventListener("amplitude" as any, handleAmplitude);
       document.removeEventListener("popup-state" as any, handleState);